@@ -8,41 +8,331 @@ Kindleアプリのスクリーンショットを自動撮影してPDFに変換
     python kindle_to_pdf.py -n "書籍名"
 """
 
+import atexit
 import subprocess
 import time
+import io
+import os
+import select
 import sys
-import hashlib
 import shutil
+import signal
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# AppleScript実行
+# =============================================================================
+
+# AppleScriptのエラー時に返させる結果
+_OSA_ERROR = "__ERROR__"
+
+
+def _with_error_marker(script: str) -> str:
+    """スクリプトのエラー時に _OSA_ERROR を返すようにする"""
+    return f'try\n{script}\non error\nreturn "{_OSA_ERROR}"\nend try'
+
+
+def _quote_applescript(text: str) -> str:
+    """AppleScriptの文字列リテラルにする"""
+    escaped = (text.replace("\\", "\\\\")
+               .replace('"', '\\"')
+               .replace("\n", "\\n"))
+    return f'"{escaped}"'
+
+
+class _OsaDaemon:
+    """
+    常駐させたosascript（対話モード）にスクリプトを流し込んで実行する
+
+    スクリプトごとにosascriptを起動するとプロセス生成のコストが毎回かかるため、
+    1つのプロセスを使い回す
+    """
+
+    SENTINEL = "__END__"
+    TIMEOUT = 30.0  # 1回の実行結果を待つ最大時間（秒）
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+        self.dead = False
+
+    def _start(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["osascript", "-i"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def run(self, script: str) -> Optional[str]:
+        """
+        スクリプトを実行して結果を返す
+
+        Args:
+            script: AppleScriptのソース
+
+        Returns:
+            実行結果の文字列、AppleScriptのエラー時はNone
+
+        Raises:
+            OSError: osascriptプロセスが利用できない場合
+        """
+        # 対話モードは1行ずつ評価するので、複数行のスクリプトは
+        # run script に文字列として渡して1行にまとめる
+        return self._execute(f"run script {_quote_applescript(_with_error_marker(script))}")
+
+    def run_compiled(self, path: Path) -> Optional[str]:
+        """
+        コンパイル済みスクリプト（.scpt）を実行して結果を返す
+
+        Raises:
+            OSError: osascriptプロセスが利用できない場合
+        """
+        return self._execute(f"run script (POSIX file {_quote_applescript(str(path))})")
+
+    def _execute(self, command: str) -> Optional[str]:
+        if self.dead:
+            raise OSError("osascript daemon is not running")
+
+        try:
+            if self._proc is None:
+                self._proc = self._start()
+            assert self._proc.stdin is not None
+
+            # 結果の後に終端マーカーを出力させ、そこまでを1回分の結果として読む
+            self._proc.stdin.write(f'{command}\n"{self.SENTINEL}"\n'.encode("utf-8"))
+            self._proc.stdin.flush()
+
+            lines, failed = self._read_result(self._proc)
+        except OSError:
+            # 応答がない・終了した場合は以後使わない（呼び出し側で都度起動に切り替える）
+            self.dead = True
+            if self._proc is not None:
+                self._proc.kill()
+            raise
+
+        output = "\n".join(lines)
+        if failed or output == _OSA_ERROR:
+            return None
+        return output
+
+    def _read_result(self, proc: subprocess.Popen) -> tuple[list[str], bool]:
+        """
+        終端マーカーまでの出力を読む
+
+        run script に渡した文字列の構文エラーや .scpt の読み込み失敗は
+        スクリプト内の try では捕捉できず標準エラー出力にだけ出るため、
+        標準エラー出力も読んでエラーの有無を判定する
+
+        Returns:
+            (結果の行, エラー出力があったか)
+
+        Raises:
+            OSError: osascriptが終了した、または TIMEOUT 秒以内に応答がない場合
+        """
+        assert proc.stdout is not None and proc.stderr is not None
+        stdout_fd = proc.stdout.fileno()
+        stderr_fd = proc.stderr.fileno()
+        deadline = time.monotonic() + self.TIMEOUT
+
+        buffer = b""
+        errors = b""
+        lines: list[str] = []
+        while True:
+            remaining = deadline - time.monotonic()
+            ready, _, _ = select.select([stdout_fd, stderr_fd], [], [], max(remaining, 0))
+            if not ready:
+                raise OSError("osascript daemon timed out")
+
+            if stderr_fd in ready:
+                chunk = os.read(stderr_fd, 65536)
+                if not chunk:
+                    raise OSError("osascript daemon exited")
+                errors += chunk
+            if stdout_fd not in ready:
+                continue
+
+            chunk = os.read(stdout_fd, 65536)
+            if not chunk:
+                raise OSError("osascript daemon exited")
+            *complete, buffer = (buffer + chunk).split(b"\n")
+
+            for raw in complete:
+                text = self._strip_prompt(raw.decode("utf-8", errors="replace"))
+                if text == self.SENTINEL:
+                    # 終端マーカーより後に届いたエラー出力も今回の実行のものとして読む
+                    while select.select([stderr_fd], [], [], 0)[0]:
+                        chunk = os.read(stderr_fd, 65536)
+                        if not chunk:
+                            break
+                        errors += chunk
+                    failed = bool(self._strip_prompt(errors.decode("utf-8", errors="replace")))
+                    return lines, failed
+                if text:
+                    lines.append(text)
+
+    @staticmethod
+    def _strip_prompt(text: str) -> str:
+        """プロンプト（>>）と結果の接頭辞（=>）を除去"""
+        text = text.strip()
+        while text.startswith((">>", "=>")):
+            text = text[2:].lstrip()
+        return text
+
+
+_osa_daemon = _OsaDaemon()
+
+# スクリプトのソース → コンパイル済みスクリプトのパス（コンパイル失敗時はNone）
+_compiled_scripts: dict[str, Optional[Path]] = {}
+
+
+def _temp_dir() -> Path:
+    """プロセスごとの一時ディレクトリ（終了時に削除する）"""
+    temp_dir = Path(tempfile.gettempdir()) / f"kindle_to_pdf_{os.getpid()}"
+    if not temp_dir.exists():
+        temp_dir.mkdir()
+        atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
+    return temp_dir
+
+
+def _compile_script(script: str) -> Optional[Path]:
+    """
+    AppleScriptを osacompile で .scpt にコンパイル（同じスクリプトは1回だけ）
+
+    Returns:
+        コンパイル済みスクリプトのパス、失敗した場合はNone
+    """
+    if script in _compiled_scripts:
+        return _compiled_scripts[script]
+
+    path = _temp_dir() / f"script_{len(_compiled_scripts)}.scpt"
+
+    try:
+        result = subprocess.run(
+            ["osacompile", "-o", str(path), "-e", _with_error_marker(script)],
+            capture_output=True
+        )
+        compiled = path if result.returncode == 0 else None
+    except OSError:
+        compiled = None
+
+    _compiled_scripts[script] = compiled
+    return compiled
+
+
+def run_osascript(script: str, compiled: bool = False) -> Optional[str]:
+    """
+    AppleScriptを実行して結果を返す
+
+    常駐osascriptが使えなくなった場合は都度osascriptを起動して実行する
+
+    Args:
+        script: AppleScriptのソース
+        compiled: Trueならコンパイル済みスクリプトを作成して実行する
+            （繰り返し実行する固定のスクリプト向け。構文解析を毎回行わない）
+
+    Returns:
+        実行結果の文字列、失敗した場合はNone
+    """
+    path = _compile_script(script) if compiled else None
+
+    try:
+        if path is not None:
+            return _osa_daemon.run_compiled(path)
+        return _osa_daemon.run(script)
+    except OSError:
+        pass
+
+    command = ["osascript", str(path)] if path is not None else ["osascript", "-e", script]
+    result = subprocess.run(command, capture_output=True, text=True)
+    output = result.stdout.strip()
+    if result.returncode != 0 or output == _OSA_ERROR:
+        return None
+    return output
+
+
+def run_applescript(script: str, compiled: bool = False) -> bool:
+    """AppleScriptを実行"""
+    return run_osascript(script, compiled) is not None
 
 
 # =============================================================================
 # 事前チェック
 # =============================================================================
 
+@dataclass
+class KindleState:
+    """Kindleアプリの状態"""
+    running: bool
+    window_count: int
+    bounds: Optional[tuple[int, int, int, int]]
+
+
+def poll_kindle_state(activate: bool = False) -> KindleState:
+    """
+    Kindleアプリの状態を1回のosascript呼び出しでまとめて取得
+
+    Args:
+        activate: Trueなら同じスクリプト内でKindleを最前面に持ってくる
+
+    Returns:
+        KindleState（起動状態・ウィンドウ数・ウィンドウ位置とサイズ）
+    """
+    activate_line = "set frontmost to true" if activate else ""
+    script = f'''
+    tell application "System Events"
+        if not (exists process "Kindle") then return {{false, 0}}
+        tell process "Kindle"
+            {activate_line}
+            set windowCount to count of windows
+            if windowCount is 0 then return {{true, 0}}
+            -- まず "Kindle" という名前のウィンドウを使う（メインウィンドウ）
+            set targetWindow to window 1
+            if exists window "Kindle" then set targetWindow to window "Kindle"
+            -- 高さが100px未満はツールバーの可能性があるので別のウィンドウを使う
+            if item 2 of (get size of targetWindow) < 100 and windowCount > 1 then
+                set targetWindow to window 2
+            end if
+            return {{true, windowCount, position of targetWindow, size of targetWindow}}
+        end tell
+    end tell
+    '''
+    output = run_osascript(script, compiled=True) or ""
+
+    # "running, count[, x, y, width, height]" の形式でパース
+    values = [v.strip() for v in output.split(",")]
+    running = values[0] == "true"
+    try:
+        window_count = int(values[1])
+    except (ValueError, IndexError):
+        return KindleState(running, 0, None)
+
+    bounds = None
+    try:
+        x, y, width, height = (int(v) for v in values[2:6])
+        bounds = (x, y, width, height)
+    except ValueError:
+        pass
+
+    return KindleState(running, window_count, bounds)
+
+
 def check_kindle_running() -> bool:
     """Kindleアプリが起動しているか確認"""
-    result = subprocess.run(
-        ["osascript", "-e",
-         'tell application "System Events" to (name of every process) contains "Kindle"'],
-        capture_output=True, text=True
-    )
-    return result.stdout.strip() == "true"
+    return poll_kindle_state().running
 
 
 def check_kindle_window_exists() -> bool:
     """Kindleウィンドウが存在するか確認"""
-    result = subprocess.run(
-        ["osascript", "-e",
-         'tell application "System Events" to tell process "Kindle" to count of windows'],
-        capture_output=True, text=True
-    )
-    try:
-        return int(result.stdout.strip()) > 0
-    except ValueError:
-        return False
+    return poll_kindle_state().window_count > 0
 
 
 def get_kindle_window_bounds() -> Optional[tuple[int, int, int, int]]:
@@ -52,51 +342,46 @@ def get_kindle_window_bounds() -> Optional[tuple[int, int, int, int]]:
     Returns:
         (x, y, width, height) または None
     """
-    # まず "Kindle" という名前のウィンドウを試す（メインウィンドウ）
-    result = subprocess.run(
-        ["osascript", "-e",
-         'tell application "System Events" to tell process "Kindle" '
-         'to get {position, size} of window "Kindle"'],
-        capture_output=True, text=True
-    )
+    return poll_kindle_state().bounds
 
-    # 失敗したら最大サイズのウィンドウを探す
-    if result.returncode != 0:
-        result = subprocess.run(
-            ["osascript", "-e",
-             'tell application "System Events" to tell process "Kindle" '
-             'to get {position, size} of window 1'],
-            capture_output=True, text=True
-        )
 
-    try:
-        # "x, y, width, height" の形式でパース
-        values = [int(v.strip()) for v in result.stdout.strip().split(",")]
-        if len(values) == 4:
-            # 高さが100px未満はツールバーの可能性があるのでスキップ
-            if values[3] < 100:
-                # 別のウィンドウを試す
-                result = subprocess.run(
-                    ["osascript", "-e",
-                     'tell application "System Events" to tell process "Kindle" '
-                     'to get {position, size} of window 2'],
-                    capture_output=True, text=True
-                )
-                values = [int(v.strip()) for v in result.stdout.strip().split(",")]
-            return tuple(values)  # type: ignore
-    except (ValueError, IndexError):
-        pass
+def activate_kindle() -> None:
+    """Kindleアプリを最前面に持ってくる"""
+    run_applescript('tell application "Amazon Kindle" to activate', compiled=True)
+    time.sleep(0.3)
+
 
+def _wait_for(predicate: Callable[[], T], timeout: float = 15.0,
+              start: float = 0.05, factor: float = 1.7) -> Optional[T]:
+    """
+    条件が満たされるまで待機（間隔を指数的に伸ばしながらポーリング）
+
+    Args:
+        predicate: 条件を満たしたら真となる値を返す関数
+        timeout: 最大待機時間（秒）
+        start: 最初のポーリング間隔（秒）
+        factor: ポーリング間隔の倍率（最大1秒）
+
+    Returns:
+        条件を満たしたときの predicate の戻り値、タイムアウトしたらNone
+    """
+    interval = start
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        value = predicate()
+        if value:
+            return value
+        time.sleep(interval)
+        interval = min(interval * factor, 1.0)
     return None
 
 
-def activate_kindle() -> None:
-    """Kindleアプリを最前面に持ってくる"""
-    subprocess.run(
-        ["osascript", "-e", 'tell application "Amazon Kindle" to activate'],
-        capture_output=True
+def bring_kindle_to_front() -> bool:
+    """Kindleを最前面にする（activate_kindle と違い待機しない）"""
+    return run_applescript(
+        'tell application "System Events" to set frontmost of process "Kindle" to true',
+        compiled=True
     )
-    time.sleep(0.3)
 
 
 def launch_kindle() -> bool:
@@ -109,18 +394,13 @@ def launch_kindle() -> bool:
 
     # openコマンドでKindleを起動（アプリ名は「Amazon Kindle」）
     subprocess.run(["open", "-a", "Amazon Kindle"], capture_output=True)
-    time.sleep(5)
 
     # 起動を待つ
-    for _ in range(15):
-        if check_kindle_running():
-            activate_kindle()
-            time.sleep(2)
-            if check_kindle_window_exists():
-                return True
-        time.sleep(1)
+    if not _wait_for(check_kindle_running, timeout=20.0):
+        return False
 
-    return False
+    activate_kindle()
+    return bool(_wait_for(check_kindle_window_exists, timeout=30.0))
 
 
 def setup_split_screen() -> bool:
@@ -130,13 +410,10 @@ def setup_split_screen() -> bool:
     print("  画面を左右分割中...")
 
     # 画面サイズを取得
-    result = subprocess.run(
-        ["osascript", "-e", 'tell application "Finder" to get bounds of window of desktop'],
-        capture_output=True, text=True
-    )
+    output = run_osascript('tell application "Finder" to get bounds of window of desktop')
 
     try:
-        bounds = [int(x.strip()) for x in result.stdout.strip().split(",")]
+        bounds = [int(x.strip()) for x in (output or "").split(",")]
         screen_width = bounds[2]
         screen_height = bounds[3]
     except (ValueError, IndexError):
@@ -156,7 +433,7 @@ def setup_split_screen() -> bool:
         end if
     end tell
     '''
-    subprocess.run(["osascript", "-e", terminal_script], capture_output=True)
+    run_applescript(terminal_script)
 
     # Kindleを右半分に配置
     kindle_script = f'''
@@ -167,23 +444,38 @@ def setup_split_screen() -> bool:
         end tell
     end tell
     '''
-    subprocess.run(["osascript", "-e", kindle_script], capture_output=True)
+    run_applescript(kindle_script)
 
     time.sleep(0.5)
     print(f"  ✓ 画面分割完了 (左: ターミナル, 右: Kindle)")
     return True
 
 
-def run_applescript(script: str) -> bool:
-    """AppleScriptを実行"""
-    result = subprocess.run(["osascript", "-e", script], capture_output=True)
-    return result.returncode == 0
+def _focused_element_role() -> Optional[str]:
+    """Kindleでフォーカスされている要素のロール（AXTextField など）を取得"""
+    return run_osascript(
+        'tell application "System Events" to tell process "Kindle" '
+        'to get role of (value of attribute "AXFocusedUIElement")',
+        compiled=True
+    )
+
+
+def _wait_until_focus(role: str = "AXTextField", timeout: float = 2.0) -> bool:
+    """指定したロールの要素（検索ボックスなど）にフォーカスが移るまで待機"""
+    return bool(_wait_for(lambda: _focused_element_role() == role, timeout=timeout))
+
+
+def _kindle_window_title() -> Optional[str]:
+    """Kindleの最前面ウィンドウのタイトルを取得"""
+    return run_osascript(
+        'tell application "System Events" to tell process "Kindle" to get name of window 1',
+        compiled=True
+    )
 
 
 def go_to_library() -> bool:
     """Kindleライブラリに戻る"""
     activate_kindle()
-    time.sleep(0.5)
 
     # Cmd+Shift+L でライブラリに戻る
     success = run_applescript('''
@@ -211,7 +503,6 @@ def search_and_open_book(book_name: str) -> bool:
 
     # ライブラリに戻る
     go_to_library()
-    time.sleep(1)
 
     # 検索ボックスにフォーカス（Cmd+F）
     run_applescript('''
@@ -221,7 +512,7 @@ def search_and_open_book(book_name: str) -> bool:
         end tell
     end tell
     ''')
-    time.sleep(0.5)
+    _wait_until_focus("AXTextField")
 
     # 検索ボックスをクリア（Cmd+A で全選択してから入力）
     run_applescript('''
@@ -231,7 +522,6 @@ def search_and_open_book(book_name: str) -> bool:
         end tell
     end tell
     ''')
-    time.sleep(0.2)
 
     # 書籍名を入力
     # 特殊文字をエスケープ
@@ -243,7 +533,6 @@ def search_and_open_book(book_name: str) -> bool:
         end tell
     end tell
     ''')
-    time.sleep(1)
 
     # Enterで検索実行
     run_applescript('''
@@ -263,9 +552,10 @@ def search_and_open_book(book_name: str) -> bool:
         click_x = x + 150
         click_y = y + 250
 
-        # ダブルクリックで開く
+        # ダブルクリックで開く（ウィンドウのタイトルが変わったら開いたとみなす）
+        library_title = _kindle_window_title()
         subprocess.run(["cliclick", f"dc:{click_x},{click_y}"], capture_output=True)
-        time.sleep(3)
+        _wait_for(lambda: _kindle_window_title() not in (None, library_title), timeout=5.0)
 
     print(f"  書籍を開きました: {book_name}")
     return True
@@ -291,16 +581,87 @@ def go_to_first_page() -> bool:
 # スクリーンショット
 # =============================================================================
 
-def capture_window(output_path: str, bounds: tuple[int, int, int, int]) -> bool:
+def find_kindle_window_id(bounds: tuple[int, int, int, int]) -> Optional[int]:
+    """
+    CoreGraphicsでKindleウィンドウのIDを取得
+
+    Args:
+        bounds: AppleScriptで取得したウィンドウの (x, y, width, height)
+
+    Returns:
+        ウィンドウID、pyobjc（Quartz）が使えないか見つからない場合はNone
+    """
+    try:
+        import Quartz
+    except ImportError:
+        return None
+
+    # macOS 15以降のSDKでは CGWindowListCreateImage が削除されている
+    if not hasattr(Quartz, "CGWindowListCreateImage"):
+        return None
+
+    windows = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionOnScreenOnly, Quartz.kCGNullWindowID
+    ) or []
+    candidates = [w for w in windows
+                  if w.get("kCGWindowOwnerName") in ("Kindle", "Amazon Kindle")
+                  and w.get("kCGWindowLayer") == 0]
+    if not candidates:
+        return None
+
+    def distance(window) -> int:
+        b = window["kCGWindowBounds"]
+        return sum(abs(int(a) - v) for a, v in zip(
+            (b["X"], b["Y"], b["Width"], b["Height"]), bounds))
+
+    # 位置とサイズが最も近いウィンドウを選ぶ
+    return int(min(candidates, key=distance)["kCGWindowNumber"])
+
+
+def _capture_with_quartz(rect: tuple[int, int, int, int], window_id: int) -> Optional[bytes]:
+    """CGWindowListCreateImageでウィンドウを直接撮影してBMPにする（プロセス起動なし）"""
+    try:
+        import Quartz
+        from CoreFoundation import CFDataCreateMutable
+    except ImportError:
+        return None
+
+    x, y, width, height = rect
+    image = Quartz.CGWindowListCreateImage(
+        Quartz.CGRectMake(x, y, width, height),
+        Quartz.kCGWindowListOptionIncludingWindow,
+        window_id,
+        Quartz.kCGWindowImageDefault,
+    )
+    if image is None:
+        return None
+
+    data = CFDataCreateMutable(None, 0)
+    destination = Quartz.CGImageDestinationCreateWithData(data, "com.microsoft.bmp", 1, None)
+    if destination is None:
+        return None
+    Quartz.CGImageDestinationAddImage(destination, image, None)
+    if not Quartz.CGImageDestinationFinalize(destination):
+        return None
+
+    return bytes(data)
+
+
+def capture_window(bounds: tuple[int, int, int, int],
+                   window_id: Optional[int] = None) -> Optional[bytes]:
     """
     指定した矩形領域のスクリーンショットを撮影
 
+    window_id が指定されていればCoreGraphicsで直接撮影し、
+    使えない場合は screencapture コマンドで撮影する。
+    撮影中の負荷を減らすため無圧縮のBMPで撮影する（保存は save_page で行う）
+
     Args:
-        output_path: 出力ファイルパス
         bounds: (x, y, width, height)
+        window_id: KindleウィンドウのID（find_kindle_window_id で取得）
 
     Returns:
-        成功したらTrue
+        BMP画像のバイト列、失敗した場合はNone
     """
     x, y, width, height = bounds
 
@@ -309,11 +670,53 @@ def capture_window(output_path: str, bounds: tuple[int, int, int, int]) -> bool:
     y += title_bar_height
     height -= title_bar_height
 
+    if window_id is not None:
+        image_data = _capture_with_quartz((x, y, width, height), window_id)
+        if image_data is not None:
+            return image_data
+
+    # 一時ディレクトリ（メモリにキャッシュされる）に撮影してメモリに読み込む
+    # 出力フォルダへの書き込みは新しいページと判定されたときだけ行う
+    # （撮影のたびに同じファイルを上書きし、終了時にディレクトリごと削除する）
+    scratch_path = _temp_dir() / "capture.bmp"
+
     result = subprocess.run(
-        ["screencapture", "-x", "-R", f"{x},{y},{width},{height}", output_path],
+        ["screencapture", "-x", "-t", "bmp", "-R", f"{x},{y},{width},{height}", str(scratch_path)],
         capture_output=True
     )
-    return result.returncode == 0
+    if result.returncode != 0:
+        return None
+
+    try:
+        return scratch_path.read_bytes()
+    except OSError:
+        return None
+
+
+def decode_page(image_data: bytes):
+    """
+    撮影した画像をデコードしてハッシュを求める
+
+    デコードした画像はハッシュ計算と保存（save_page）で使い回す
+
+    Returns:
+        (ハッシュ, デコードした画像)
+    """
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(image_data))
+    img.load()
+    return get_image_hash(image_data, img), img
+
+
+def save_page(img, path: Path) -> None:
+    """
+    撮影した画像をPNGで保存
+
+    無圧縮のBMPのままだと1ページ数十MBになるため、低い圧縮レベルで素早く圧縮して保存する
+    （PDF用の圧縮は後処理の process_images で行う）
+    """
+    img.save(path, "PNG", compress_level=1)
 
 
 # =============================================================================
@@ -322,175 +725,335 @@ def capture_window(output_path: str, bounds: tuple[int, int, int, int]) -> bool:
 
 def next_page() -> bool:
     """次のページに移動（右矢印キー）"""
-    # Kindleをアクティブにしてから矢印キーを送信
-    result = subprocess.run(
-        ["osascript", "-e",
-         'tell application "System Events" to tell process "Kindle" to key code 124'],
-        capture_output=True
-    )
+    # cliclickでキーイベントを直接送る（AppleScript・System Events を経由しない）
+    result = subprocess.run(["cliclick", "kp:arrow-right"], capture_output=True)
     return result.returncode == 0
 
 
 def prev_page() -> bool:
     """前のページに移動（左矢印キー）"""
-    result = subprocess.run(
-        ["osascript", "-e",
-         'tell application "System Events" to tell process "Kindle" to key code 123'],
-        capture_output=True
-    )
+    result = subprocess.run(["cliclick", "kp:arrow-left"], capture_output=True)
     return result.returncode == 0
 
 
-def verify_page_turned(old_hash: str, new_path: str) -> tuple[bool, str]:
+def verify_page_turned(old_hash: "PageHash", new_data: bytes) -> tuple[bool, "PageHash"]:
     """
     ページがめくれたか検証
 
     Args:
         old_hash: 前のページの画像ハッシュ
-        new_path: 新しいページの画像パス
+        new_data: 新しいページの画像データ
 
     Returns:
         (ページが変わったか, 新しいハッシュ)
     """
-    new_hash = get_image_hash(new_path)
-    return old_hash != new_hash, new_hash
+    new_hash = get_image_hash(new_data)
+    return not is_similar_hash(old_hash, new_hash), new_hash
 
 
 # =============================================================================
 # 重複検出
 # =============================================================================
 
-def get_image_hash(filepath: str) -> str:
-    """画像ファイルのMD5ハッシュを取得"""
-    with open(filepath, 'rb') as f:
-        return hashlib.md5(f.read()).hexdigest()
+@dataclass(frozen=True)
+class PageHash:
+    """ページ画像の比較用ハッシュ（get_image_hash の戻り値）"""
+    digest: bytes                   # 画像データのハッシュ（完全一致の判定用）
+    thumbnail: bytes                # 1/4に縮小したグレースケール画素（近似一致の判定用）
+    thumbnail_size: tuple[int, int]
+
+
+def get_image_hash(image_data: bytes, img=None) -> PageHash:
+    """
+    画像の比較用ハッシュを取得
+
+    画像データの完全一致用ハッシュと、近似一致の判定用に
+    1/4に縮小したグレースケール画像を求める
+
+    Args:
+        image_data: 画像データ
+        img: デコード済みの画像（指定すれば image_data をデコードしない）
+    """
+    import xxhash
+    from PIL import Image
+
+    # 撮影画像は無圧縮のBMP（タイムスタンプなどのメタデータなし）なので、
+    # デコードせずにバイト列をそのままハッシュする
+    digest = xxhash.xxh3_128(image_data).digest()
+
+    if img is not None:
+        thumbnail = img.convert('L').reduce(4)
+    else:
+        with Image.open(io.BytesIO(image_data)) as img:
+            thumbnail = img.convert('L').reduce(4)
+
+    return PageHash(digest, thumbnail.tobytes(), thumbnail.size)
+
+
+def is_similar_hash(hash1: PageHash, hash2: PageHash) -> bool:
+    """
+    2つのハッシュが同じページとみなせるか判定
+
+    画像データが完全に一致するか、縮小画像のどの画素も明るさの差が16以下なら
+    同じページとみなす。描画の細かな揺らぎは縮小で平均化されて数段階の差に収まり、
+    見出しの1文字の違い（「第1章」と「第2章」など）は大きな差として残るため、
+    見出しだけのページや白紙のページも取りこぼさない
+    """
+    import numpy as np
+
+    if hash1.digest == hash2.digest:
+        return True
+    if hash1.thumbnail_size != hash2.thumbnail_size:
+        return False
+
+    pixels1 = np.frombuffer(hash1.thumbnail, dtype=np.uint8).astype(np.int16)
+    pixels2 = np.frombuffer(hash2.thumbnail, dtype=np.uint8).astype(np.int16)
+    return int(np.abs(pixels1 - pixels2).max()) <= 16
 
 
 def is_same_page(path1: str, path2: str) -> bool:
     """2つの画像が同じかどうか判定"""
-    return get_image_hash(path1) == get_image_hash(path2)
+    return is_similar_hash(
+        get_image_hash(Path(path1).read_bytes()),
+        get_image_hash(Path(path2).read_bytes()),
+    )
 
 
 # =============================================================================
 # 画像処理
 # =============================================================================
 
-def process_images(folder: Path) -> None:
+def process_images(folder: Path, show_progress: bool = True) -> None:
     """
     画像の後処理（トリミング・最適化）
 
+    ページごとに独立した処理なので、複数プロセスで並列に実行する
+
     Args:
         folder: 画像フォルダ
+        show_progress: 進捗を表示するか（バックグラウンド実行時は撮影の進捗表示と
+                       重ならないようにFalseにする）
     """
-    from PIL import Image
-
-    print("\n画像を処理中...")
+    if show_progress:
+        print("\n画像を処理中...")
 
     image_files = sorted(folder.glob("page_*.png"))
     total = len(image_files)
 
-    for i, img_path in enumerate(image_files, 1):
-        print(f"  処理中: {i}/{total}", end="\r")
+    max_workers = min(os.cpu_count() or 1, 8)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_ignore_sigint) as executor:
+        for i, _ in enumerate(executor.map(_process_one, image_files, chunksize=4), 1):
+            if show_progress:
+                print(f"  処理中: {i}/{total}", end="\r")
 
-        img = Image.open(img_path)
+    if show_progress:
+        print(f"  処理完了: {total}枚")
 
-        # Kindleのツールバー領域を除去（上下各50px程度）
-        width, height = img.size
-        top_crop = 50
-        bottom_crop = 50
-        img = img.crop((0, top_crop, width, height - bottom_crop))
 
-        # 余白をトリミング（白い領域を検出）
-        img = trim_whitespace(img)
-
-        # 最適化して保存
-        img.save(img_path, "PNG", optimize=True)
+def _ignore_sigint() -> None:
+    """
+    ワーカープロセスでCtrl+Cを無視する（process_images のワーカー初期化用）
 
-    print(f"  処理完了: {total}枚")
+    Ctrl+Cは撮影中の書籍の停止に使うため、バックグラウンドで実行中の
+    画像処理のワーカーまで終了しないようにする
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
 
 
-def trim_whitespace(img):
+def _process_one(img_path: Path) -> None:
     """
-    画像の余白（白い領域）をトリミング
-
-    Args:
-        img: PIL Image オブジェクト
+    1ページ分の後処理（process_images からワーカープロセスで呼ばれる）
 
-    Returns:
-        トリミングされた画像
+    撮影したPNGをデコードしてRGBの画素配列にし、ツールバー除去と余白トリミングを
+    配列のスライスでまとめて行ってから、PDF用のPNGにエンコードして上書きする
     """
+    import numpy as np
     from PIL import Image
 
-    # グレースケールに変換して白い領域を検出
-    gray = img.convert('L')
-    bbox = gray.getbbox()
+    # PDFにはPNGのデータをそのまま埋め込むので、ここでRGBに変換しておく
+    with Image.open(img_path) as img:
+        pixels = np.asarray(_to_rgb(img))
+
+    # Kindleのツールバー領域を除去（上下各50px程度）
+    top_crop = 50
+    bottom_crop = 50
+    pixels = pixels[top_crop:pixels.shape[0] - bottom_crop]
 
+    # 余白をトリミング（いずれかのチャンネルが240未満の画素を内容とみなす）
+    bbox = _content_bbox(pixels.min(axis=2) < 240)
     if bbox:
-        # 少しマージンを追加
-        margin = 10
-        x1 = max(0, bbox[0] - margin)
-        y1 = max(0, bbox[1] - margin)
-        x2 = min(img.width, bbox[2] + margin)
-        y2 = min(img.height, bbox[3] + margin)
-        return img.crop((x1, y1, x2, y2))
+        x1, y1, x2, y2 = bbox
+        pixels = pixels[y1:y2, x1:x2]
+
+    # 保存したPNGの圧縮データがそのままPDFに入るので、標準の圧縮レベルで保存
+    Image.fromarray(pixels).save(img_path, "PNG", compress_level=6)
+
+
+def _to_rgb(img):
+    """画像をRGBに変換（透過部分は白で塗りつぶす）"""
+    from PIL import Image
 
+    if img.mode == 'RGBA':
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[3])
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
     return img
 
 
+def _content_bbox(mask, margin: int = 10) -> Optional[tuple[int, int, int, int]]:
+    """
+    内容のある画素（mask が True）を囲む範囲を求める
+
+    Args:
+        mask: 内容のある画素を True とした2次元配列
+        margin: 範囲の周りに追加するマージン（px）
+
+    Returns:
+        (x1, y1, x2, y2)、内容がなければNone
+    """
+    import numpy as np
+
+    ys = np.flatnonzero(mask.any(axis=1))
+    xs = np.flatnonzero(mask.any(axis=0))
+    if ys.size == 0:
+        return None
+
+    height, width = mask.shape
+    return (
+        max(0, int(xs[0]) - margin),
+        max(0, int(ys[0]) - margin),
+        min(width, int(xs[-1]) + 1 + margin),
+        min(height, int(ys[-1]) + 1 + margin),
+    )
+
+
 # =============================================================================
 # PDF変換
 # =============================================================================
 
-def images_to_pdf(folder: Path, output_pdf: str) -> bool:
+def images_to_pdf(folder: Path, output_pdf: str, show_progress: bool = True) -> bool:
     """
     画像ファイルをPDFに結合
 
+    PNGの圧縮データをそのままPDFに埋め込むため、画像の再エンコードは行わない。
+    1ページずつファイルへ書き出し、保持するのは各オブジェクトの位置だけなので、
+    メモリ使用量はページ数によらず1ページ分で済む
+
     Args:
         folder: 画像フォルダ
         output_pdf: 出力PDFパス
+        show_progress: 進捗を表示するか
 
     Returns:
         成功したらTrue
     """
-    from PIL import Image
-
     image_files = sorted(folder.glob("page_*.png"))
 
     if not image_files:
-        print("エラー: 画像ファイルが見つかりません")
+        print("\nエラー: 画像ファイルが見つかりません")
         return False
 
-    print(f"\n{len(image_files)}枚の画像をPDFに変換中...")
+    if show_progress:
+        print(f"\n{len(image_files)}枚の画像をPDFに変換中...")
+
+    # オブジェクト番号: 1=カタログ, 2=ページツリー（最後に書く）, 3以降=各ページ（画像・内容・ページ）
+    offsets: dict[int, int] = {}
+    page_ids: list[int] = []
+
+    with open(output_pdf, "wb") as f:
+        def write_object(obj_id: int, body: bytes, stream: Optional[bytes] = None) -> None:
+            offsets[obj_id] = f.tell()
+            f.write(f"{obj_id} 0 obj\n".encode("ascii") + body)
+            if stream is not None:
+                f.write(b"\nstream\n")
+                f.write(stream)
+                f.write(b"\nendstream")
+            f.write(b"\nendobj\n")
+
+        f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+        for i, path in enumerate(image_files):
+            width, height, colors, data = _read_png(path)
+            image_id, contents_id, page_id = 3 + i * 3, 4 + i * 3, 5 + i * 3
+
+            # ページサイズはトリミング後の画像の150dpi相当
+            page_width = width * 72 / 150
+            page_height = height * 72 / 150
+
+            color_space = "/DeviceRGB" if colors == 3 else "/DeviceGray"
+            write_object(image_id, (
+                f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+                f"/ColorSpace {color_space} /BitsPerComponent 8 /Filter /FlateDecode "
+                f"/DecodeParms << /Predictor 15 /Colors {colors} /BitsPerComponent 8 "
+                f"/Columns {width} >> /Length {len(data)} >>"
+            ).encode("ascii"), data)
+
+            contents = f"q {page_width:.2f} 0 0 {page_height:.2f} 0 0 cm /Im0 Do Q".encode("ascii")
+            write_object(contents_id, f"<< /Length {len(contents)} >>".encode("ascii"), contents)
+
+            write_object(page_id, (
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width:.2f} {page_height:.2f}] "
+                f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> /Contents {contents_id} 0 R >>"
+            ).encode("ascii"))
+            page_ids.append(page_id)
+
+        kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+        write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode("ascii"))
+        write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+        # 相互参照表とトレーラー
+        xref_offset = f.tell()
+        size = max(offsets) + 1
+        f.write(f"xref\n0 {size}\n0000000000 65535 f \n".encode("ascii"))
+        for obj_id in range(1, size):
+            f.write(f"{offsets[obj_id]:010d} 00000 n \n".encode("ascii"))
+        f.write(f"trailer\n<< /Size {size} /Root 1 0 R >>\n"
+                f"startxref\n{xref_offset}\n%%EOF\n".encode("ascii"))
 
-    images = []
-    first_image = None
+    return True
 
-    for img_path in image_files:
-        img = Image.open(img_path)
 
-        # RGBに変換
-        if img.mode == 'RGBA':
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
+def _read_png(path: Path) -> tuple[int, int, int, bytes]:
+    """
+    PNGファイルから画像サイズと圧縮データ（IDATチャンク）を読み出す
 
-        if first_image is None:
-            first_image = img
-        else:
-            images.append(img)
-
-    # PDFとして保存
-    first_image.save(
-        output_pdf,
-        "PDF",
-        resolution=150.0,
-        save_all=True,
-        append_images=images
-    )
+    process_images が保存する8bit・非インターレースのRGB（またはグレースケール）の
+    PNGのみ対応する
 
-    return True
+    Returns:
+        (幅, 高さ, 色成分数, 圧縮データ)
+
+    Raises:
+        ValueError: 対応していない形式のPNGの場合
+    """
+    raw = path.read_bytes()
+    if raw[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError(f"PNGファイルではありません: {path}")
+
+    width = height = colors = 0
+    idat = []
+    pos = 8
+    while pos < len(raw):
+        length = int.from_bytes(raw[pos:pos + 4], "big")
+        chunk_type = raw[pos + 4:pos + 8]
+        chunk = raw[pos + 8:pos + 8 + length]
+        pos += 12 + length
+
+        if chunk_type == b"IHDR":
+            width = int.from_bytes(chunk[0:4], "big")
+            height = int.from_bytes(chunk[4:8], "big")
+            bit_depth, color_type, interlace = chunk[8], chunk[9], chunk[12]
+            if bit_depth != 8 or interlace != 0 or color_type not in (0, 2):
+                raise ValueError(f"対応していないPNG形式です: {path}")
+            colors = 3 if color_type == 2 else 1
+        elif chunk_type == b"IDAT":
+            idat.append(chunk)
+        elif chunk_type == b"IEND":
+            break
+
+    return width, height, colors, b"".join(idat)
 
 
 # =============================================================================
@@ -510,6 +1073,28 @@ def run_capture(book_name: str, wait_time: float = 0.5, max_pages: int = 2000, t
     Returns:
         生成されたPDFのパス、失敗した場合はNone
     """
+    captured = capture_book(book_name, wait_time, max_pages, test_mode)
+    if not captured:
+        return None
+
+    output_folder, timestamp = captured
+    return build_pdf(output_folder, book_name, timestamp)
+
+
+def capture_book(book_name: str, wait_time: float = 0.5, max_pages: int = 2000,
+                 test_mode: bool = False) -> Optional[tuple[Path, str]]:
+    """
+    開いている書籍のスクリーンショットを撮影
+
+    Args:
+        book_name: 書籍名
+        wait_time: ページめくり間隔（秒）
+        max_pages: 最大ページ数
+        test_mode: テストモード（5ページのみ撮影して検証）
+
+    Returns:
+        (画像フォルダ, タイムスタンプ)、失敗した場合はNone
+    """
     if test_mode:
         max_pages = 5
         print("\n【テストモード】5ページのみ撮影して動作確認します")
@@ -525,11 +1110,15 @@ def run_capture(book_name: str, wait_time: float = 0.5, max_pages: int = 2000, t
         print("エラー: Kindleウィンドウの情報を取得できません")
         return None
 
+    # CoreGraphicsで直接撮影するためのウィンドウID（使えなければscreencapture）
+    window_id = find_kindle_window_id(bounds)
+
     print(f"\n設定:")
     print(f"  書籍名: {book_name}")
     print(f"  ウィンドウ: {bounds[2]}x{bounds[3]} @ ({bounds[0]}, {bounds[1]})")
     print(f"  待機時間: {wait_time}秒")
     print(f"  ページめくり: 矢印キー方式")
+    print(f"  撮影方式: {'CoreGraphics' if window_id is not None else 'screencapture'}")
     print()
 
     # Kindleを最前面に
@@ -551,54 +1140,68 @@ def run_capture(book_name: str, wait_time: float = 0.5, max_pages: int = 2000, t
     print()
 
     # 撮影ループ
-    last_hash = None
-    same_count = 0
+    # 直近のページのハッシュ（末尾で2ページを行き来する場合の検出用）
+    recent_hashes: deque[PageHash] = deque(maxlen=8)
+    looped_pages: list[Path] = []  # 行き来の間に保存したページ
+    duplicate_pages: list[Path] = []  # 終了時に削除する重複ページ
+    save_futures: list[Future[None]] = []
+    same_count = 0  # 同じページが連続した回数
+    loop_count = 0  # 少し前のページに戻った回数（連続）
     page = 0
     failed_turns = 0  # ページめくり失敗カウント
     start_time = time.time()
 
+    # ハッシュ計算とPNGの保存はページめくり後の描画待ちの間にバックグラウンドで行う
+    hash_executor = ThreadPoolExecutor(max_workers=1)
+
     try:
         while page < max_pages:
             page += 1
             output_path = output_folder / f"page_{page:04d}.png"
 
             # Kindleを最前面に維持
-            activate_kindle()
+            bring_kindle_to_front()
             time.sleep(0.1)
 
-            # ウィンドウ位置を再取得
-            current_bounds = get_kindle_window_bounds()
-            if current_bounds:
-                bounds = current_bounds
-
             # スクリーンショット撮影
-            if not capture_window(str(output_path), bounds):
+            # 撮影中はウィンドウを動かさない前提なので、位置は失敗したときだけ再取得する
+            image_data = capture_window(bounds, window_id)
+            if image_data is None:
                 print(f"\n警告: ページ {page} の撮影に失敗")
+                bounds = get_kindle_window_bounds() or bounds
                 continue
 
+            # 先にページをめくり（矢印キー方式）、Kindleが描画している間に
+            # 撮影した画像のハッシュを計算する
+            next_page()
+            hash_future = hash_executor.submit(decode_page, image_data)
+            time.sleep(wait_time)
+
             # 重複チェック（ページがめくれたか検証）
-            current_hash = get_image_hash(str(output_path))
+            current_hash, page_image = hash_future.result()
 
-            if current_hash == last_hash:
+            if recent_hashes and is_similar_hash(current_hash, recent_hashes[-1]):
+                # ページがめくれていないのでリトライ
                 same_count += 1
-                output_path.unlink()  # 重複画像を削除
                 page -= 1
-
-                if same_count >= 5:
-                    elapsed = time.time() - start_time
-                    print(f"\n\n最後のページに到達しました")
-                    print(f"  撮影ページ数: {page}")
-                    print(f"  所要時間: {elapsed:.1f}秒")
-                    break
-
-                # ページめくりをリトライ
                 failed_turns += 1
                 if failed_turns >= 10:
                     print(f"\n警告: ページめくりが連続失敗しています")
             else:
+                # 直前と異なるページは保存する。少し前のページと同じ場合は
+                # 末尾で2ページを行き来している可能性があるため、別に数えておく
+                # （フッターの再描画などで画素が少し変わっても同じページとみなす）
                 same_count = 0
                 failed_turns = 0
-                last_hash = current_hash
+                if any(is_similar_hash(current_hash, h) for h in recent_hashes):
+                    loop_count += 1
+                    looped_pages.append(output_path)
+                else:
+                    loop_count = 0
+                    looped_pages.clear()
+                recent_hashes.append(current_hash)
+
+                save_futures.append(hash_executor.submit(save_page, page_image, output_path))
 
                 # 進捗表示
                 elapsed = time.time() - start_time
@@ -606,13 +1209,30 @@ def run_capture(book_name: str, wait_time: float = 0.5, max_pages: int = 2000, t
                 status = f"  ページ {page} 撮影完了 ({rate:.1f} ページ/秒)"
                 print(status, end="\r")
 
-            # ページめくり（矢印キー方式）
-            time.sleep(wait_time)
-            next_page()
-            time.sleep(wait_time)
+            if same_count >= 5 or loop_count >= 5:
+                if loop_count >= 5:
+                    # 行き来の間に保存したページは重複なので、保存が終わってから削除する
+                    duplicate_pages = looped_pages
+                    page -= len(looped_pages)
+
+                elapsed = time.time() - start_time
+                print(f"\n\n最後のページに到達しました")
+                print(f"  撮影ページ数: {page}")
+                print(f"  所要時間: {elapsed:.1f}秒")
+                break
 
     except KeyboardInterrupt:
         print(f"\n\n中断されました（{page}ページまで撮影済み）")
+    finally:
+        # 保存待ちのページを書き終えるまで待つ
+        hash_executor.shutdown()
+
+    for path in duplicate_pages:
+        path.unlink(missing_ok=True)
+
+    failed_saves = sum(1 for f in save_futures if f.exception() is not None)
+    if failed_saves:
+        print(f"\n警告: {failed_saves}ページの保存に失敗しました")
 
     print(f"\n\n全{page}ページの撮影が完了しました！")
 
@@ -629,8 +1249,27 @@ def run_capture(book_name: str, wait_time: float = 0.5, max_pages: int = 2000, t
             shutil.rmtree(output_folder)
             return None
 
+    return output_folder, timestamp
+
+
+def build_pdf(output_folder: Path, book_name: str, timestamp: str,
+              show_progress: bool = True) -> Optional[str]:
+    """
+    撮影した画像を後処理してPDFを生成
+
+    Kindleを操作しないので、次の書籍の撮影と並行して実行できる
+
+    Args:
+        output_folder: 画像フォルダ
+        book_name: 書籍名
+        timestamp: 撮影開始時のタイムスタンプ（PDFファイル名に使用）
+        show_progress: 進捗を表示するか（Falseでもエラーは表示する）
+
+    Returns:
+        生成されたPDFのパス、失敗した場合はNone
+    """
     # 画像処理
-    process_images(output_folder)
+    process_images(output_folder, show_progress)
 
     # PDF変換
     safe_name = "".join(c for c in book_name if c.isalnum() or c in ' -_').strip()
@@ -638,12 +1277,13 @@ def run_capture(book_name: str, wait_time: float = 0.5, max_pages: int = 2000, t
         safe_name = "kindle_book"
     output_pdf = f"{safe_name}_{timestamp}.pdf"
 
-    if images_to_pdf(output_folder, output_pdf):
-        print(f"\nPDFを保存しました: {output_pdf}")
-
+    if images_to_pdf(output_folder, output_pdf, show_progress):
         # クリーンアップ
         shutil.rmtree(output_folder)
-        print("一時ファイルを削除しました")
+
+        if show_progress:
+            print(f"\nPDFを保存しました: {output_pdf}")
+            print("一時ファイルを削除しました")
 
         return output_pdf
 
@@ -664,6 +1304,23 @@ def run_capture_auto(book_name: str, wait_time: float = 0.8, max_pages: int = 20
     Returns:
         生成されたPDFのパス、失敗した場合はNone
     """
+    if not open_book(book_name):
+        return None
+
+    # 撮影実行
+    return run_capture(book_name, wait_time, max_pages)
+
+
+def open_book(book_name: str) -> bool:
+    """
+    書籍を自動で検索・オープンし、最初のページに移動して撮影の準備をする
+
+    Args:
+        book_name: 書籍名
+
+    Returns:
+        撮影できる状態になったらTrue
+    """
     print(f"\n{'='*60}")
     print(f"  処理開始: {book_name}")
     print(f"{'='*60}")
@@ -672,7 +1329,7 @@ def run_capture_auto(book_name: str, wait_time: float = 0.8, max_pages: int = 20
     if not check_kindle_running():
         if not launch_kindle():
             print("エラー: Kindleを起動できませんでした")
-            return None
+            return False
         time.sleep(2)
 
     # Kindleをアクティブに
@@ -682,7 +1339,7 @@ def run_capture_auto(book_name: str, wait_time: float = 0.8, max_pages: int = 20
     # 書籍を検索して開く
     if not search_and_open_book(book_name):
         print(f"エラー: 書籍を開けませんでした: {book_name}")
-        return None
+        return False
 
     # 書籍が開くのを待つ
     time.sleep(3)
@@ -693,20 +1350,17 @@ def run_capture_auto(book_name: str, wait_time: float = 0.8, max_pages: int = 20
     setup_split_screen()
     time.sleep(1)
 
-    # ウィンドウ情報を確認（複数回リトライ）
-    bounds = None
-    for retry in range(5):
-        activate_kindle()
-        time.sleep(0.5)
-        bounds = get_kindle_window_bounds()
-        if bounds and bounds[3] > 100:  # 高さ100px以上のウィンドウ
-            break
-        print(f"  ウィンドウ情報取得リトライ... ({retry + 1}/5)")
-        time.sleep(2)
+    # ウィンドウ情報を確認（取得できるまで待機）
+    def poll_window_bounds() -> Optional[tuple[int, int, int, int]]:
+        state = poll_kindle_state(activate=True)
+        if state.bounds and state.bounds[3] > 100:  # 高さ100px以上のウィンドウ
+            return state.bounds
+        return None
 
+    bounds = _wait_for(poll_window_bounds, timeout=15.0)
     if not bounds:
         print("エラー: Kindleウィンドウの情報を取得できません")
-        return None
+        return False
 
     print(f"  ウィンドウ確認: {bounds[2]}x{bounds[3]}")
 
@@ -714,10 +1368,7 @@ def run_capture_auto(book_name: str, wait_time: float = 0.8, max_pages: int = 20
     go_to_first_page()
     time.sleep(1)
 
-    # 撮影実行
-    result = run_capture(book_name, wait_time, max_pages)
-
-    return result
+    return True
 
 
 def process_multiple_books(book_names: list[str], wait_time: float = 0.8) -> dict[str, Optional[str]]:
@@ -753,33 +1404,52 @@ def process_multiple_books(book_names: list[str], wait_time: float = 0.8) -> dic
     time.sleep(1)
 
     # ウィンドウが正常に取得できるか確認
-    for retry in range(5):
-        bounds = get_kindle_window_bounds()
-        if bounds:
-            print(f"  ✓ Kindleウィンドウ確認: {bounds[2]}x{bounds[3]}")
-            break
-        print(f"  ウィンドウ取得待機中... ({retry + 1}/5)")
-        activate_kindle()
-        time.sleep(2)
-    else:
+    print("  ウィンドウ取得待機中...")
+    bounds = _wait_for(lambda: poll_kindle_state(activate=True).bounds, timeout=12.0)
+    if not bounds:
         print("エラー: Kindleウィンドウを取得できませんでした")
         for book_name in book_names:
             results[book_name] = None
         return results
+    print(f"  ✓ Kindleウィンドウ確認: {bounds[2]}x{bounds[3]}")
+
+    # PDF生成（画像処理・PDF変換）はKindleを操作しないので、
+    # バックグラウンドで実行しながら次の書籍の撮影に進む
+    # （画像処理自体は process_images が複数プロセスで並列化する）
+    pdf_futures: dict[str, Future[Optional[str]]] = {}
+
+    with ThreadPoolExecutor(max_workers=2) as pdf_executor:
+        for i, book_name in enumerate(book_names, 1):
+            print(f"\n[{i}/{len(book_names)}] {book_name}")
+            captured = capture_book(book_name, wait_time) if open_book(book_name) else None
+
+            if captured:
+                output_folder, timestamp = captured
+                pdf_futures[book_name] = pdf_executor.submit(
+                    build_pdf, output_folder, book_name, timestamp, False
+                )
+                print("  ✓ 撮影完了（PDF変換はバックグラウンドで実行します）")
+            else:
+                print(f"  ✗ 失敗")
 
-    for i, book_name in enumerate(book_names, 1):
-        print(f"\n[{i}/{len(book_names)}] {book_name}")
-        result = run_capture_auto(book_name, wait_time)
-        results[book_name] = result
-
-        if result:
-            print(f"  ✓ 完了: {result}")
-        else:
-            print(f"  ✗ 失敗")
+            # 次の書籍処理前に少し待機
+            if i < len(book_names):
+                time.sleep(2)
 
-        # 次の書籍処理前に少し待機
-        if i < len(book_names):
-            time.sleep(2)
+        # PDF変換の完了を待つ
+        if pdf_futures:
+            print("\nPDF変換の完了を待っています...")
+        # 1冊の失敗で他の書籍の結果を失わないよう、例外は書籍ごとに扱う
+        for book_name in book_names:
+            future = pdf_futures.get(book_name)
+            if future is None:
+                results[book_name] = None
+                continue
+            try:
+                results[book_name] = future.result()
+            except Exception as e:
+                print(f"  ✗ PDF変換に失敗しました: {book_name} ({e})")
+                results[book_name] = None
 
     # 結果サマリー
     print("\n" + "=" * 60)
@@ -853,13 +1523,7 @@ def main():
     time.sleep(1)
 
     # 3. ウィンドウ確認（分割後に再確認）
-    for retry in range(5):
-        if check_kindle_window_exists():
-            break
-        print(f"  ウィンドウ待機中... ({retry + 1}/5)")
-        activate_kindle()
-        time.sleep(1)
-    else:
+    if not _wait_for(lambda: poll_kindle_state(activate=True).window_count > 0, timeout=10.0):
         print("エラー: Kindleウィンドウが見つかりません")
         sys.exit(1)
     print("  ✓ Kindleウィンドウ確認")